@@ -1,110 +1,101 @@
 import argparse
+import importlib
+import os
 import sys
-from pathlib import Path
 
-# Import command classes
-from arcscfg.commands.build import BuildCommand
-from arcscfg.commands.config import ConfigCommand
-from arcscfg.commands.install import InstallCommand
-from arcscfg.commands.setup import SetupCommand
-from arcscfg.commands.update import UpdateCommand
-from arcscfg.utils.logger import Logger
-from arcscfg.utils.backer_upper import BackerUpper
-from arcscfg.utils.user_prompter import UserPrompter
+from arcscfg.constants import ROS_DISTROS
 
+# Command classes are imported only once the selected command is known, so
+# that e.g. `arcscfg --help` does not pay for every command's dependencies.
+_COMMAND_MAP = {
+    "install": ("arcscfg.commands.install", "InstallCommand"),
+    "config": ("arcscfg.commands.config", "ConfigCommand"),
+    "setup": ("arcscfg.commands.setup", "SetupCommand"),
+    "build": ("arcscfg.commands.build", "BuildCommand"),
+    "update": ("arcscfg.commands.update", "UpdateCommand"),
+}
 
-def main():
-    # Create the top-level parser
-    parser = argparse.ArgumentParser(
-        description="CSUN ARCS Configurator",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-    )
+_VERBOSITY_LEVELS = ("debug", "info", "warning", "error", "critical", "silent")
 
-    # Global arguments
-    parser.add_argument(
-        "-v",
-        "--verbosity",
-        choices=["debug", "info", "warning", "error", "critical", "silent"],
-        default="info",
-        help="Set the logging verbosity level.",
-    )
-    parser.add_argument(
-        "-lfp",
-        "--log-file-path",
-        default=None,
-        help=(
-            "Path to log file/directory. If None, system default location is "
-            "selected."
-        ),
-    )
-    parser.add_argument(
-        "-lms",
-        "--log-max-size",
-        type=int,
-        default=5 * 1024 * 1024,  # 5 MB
-        help="Maximum log file size (in bytes) before rotation.",
-    )
-    parser.add_argument(
-        "-lbc",
-        "--log-backup-count",
-        type=int,
-        default=5,
-        help="Number of backup log files to keep.",
-    )
-    parser.add_argument(
-        "-bd",
-        "--backup-dir",
-        type=str,
-        default=".arcscfg_backups",
-        help="Directory name where backups will be stored relative to each file's location.",
-    )
-    parser.add_argument(
-        "-bkc",
-        "--backup-count",
-        type=int,
-        default=50,
-        help="Number of backup copies to retain per file.",
-    )
-    parser.add_argument(
-        "-y",
-        "--yes",
-        "--assume-yes",
-        action="store_true",
-        help="Assume yes for all yes/no prompts and use default options otherwise.",
-    )
-    parser.add_argument(
-        "-d",
-        "--default",
-        "--assume-default",
-        action="store_true",
-        help="Assume default option for all prompts (overrides --assume-yes).",
-    )
-    parser.add_argument(
-        "-n",
-        "--no",
-        "--assume-no",
-        action="store_true",
-        help=("Assume no for all yes/no prompts and use default options otherwise "
-              "(overrides both --assume-yes and --assume-default)."),
-    )
+# Assume flags in order of precedence; each flag's dest doubles as its value
+_ASSUME_PRECEDENCE = ("no", "default", "yes")
 
-    # Create subparsers for commands
-    subparsers = parser.add_subparsers(
-        title="Commands",
-        dest="command",
-        description="Available commands",
-        help="Additional help",
-    )
-    subparsers.required = True  # Ensure that a command is provided
 
-    ### 1. Install Command ###
-    install_parser = subparsers.add_parser(
-        "install",
-        description="Install ROS 2, dependencies, etc.",
-        help="Install ROS2, dependencies, etc.",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-    )
-    # Command-specific arguments
+class _HelpFormatter(argparse.HelpFormatter):
+    """
+    Help formatter that appends the bundled workspace configs to the
+    --workspace-config help. The config directory is only scanned when help
+    is actually printed.
+    """
+
+    def _get_help_string(self, action):
+        help_text = super()._get_help_string(action)
+        if action.dest == "workspace_config":
+            from arcscfg.utils.workspace_manager import list_workspace_configs
+
+            names = ", ".join(sorted(c.stem for c in list_workspace_configs()))
+            help_text = f"{help_text} Available configs: {names}."
+        return help_text
+
+
+def _optional_path(value: str):
+    """
+    argparse type for path arguments. An empty value means "not given" and
+    maps to None. pathlib is imported on first use so that help and usage
+    errors do not pay for it.
+    """
+    if not value:
+        return None
+    from pathlib import Path
+
+    return Path(value)
+
+
+class WorkspaceConfigAction(argparse.Action):
+    """
+    Resolve --workspace-config to an existing config file at parse time, so
+    that a mistyped config name is reported as a usage error.
+    """
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from arcscfg.utils.workspace_manager import resolve_workspace_config
+
+        if not values:
+            # An empty value means "not given", as with the path options
+            setattr(namespace, self.dest, None)
+            return
+        workspace_config = resolve_workspace_config(values)
+        if workspace_config is None:
+            parser.error(f"Unrecognized workspace config: {str(values)!r}")
+        setattr(namespace, self.dest, workspace_config)
+
+
+class DependencyFileAction(argparse.Action):
+    """
+    Resolve --dependency-file to an existing config file at parse time, so
+    that a mistyped config name is reported as a usage error.
+    """
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from arcscfg.commands.install import resolve_dependencies_file
+
+        if not values:
+            setattr(namespace, self.dest, None)
+            return
+        dependency_file = resolve_dependencies_file(values)
+        if dependency_file is None:
+            parser.error(f"Unrecognized dependency config: {values!r}")
+        setattr(namespace, self.dest, dependency_file)
+
+
+def _load_command(command: str):
+    """Import and return the command class registered under `command`."""
+    module_name, class_name = _COMMAND_MAP[command]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _add_install_arguments(install_parser):
+    """Add the 'install' command arguments."""
     install_parser.add_argument(
         "-ir",
         "--install-ros2",
@@ -120,19 +111,7 @@ def main():
     install_parser.add_argument(
         "-rd",
         "--ros-distro",
-        choices=[
-            "ardent",
-            "bouncy",
-            "crystal",
-            "dashing",
-            "eloquent",
-            "foxy",
-            "galactic",
-            "humble",
-            "iron",
-            "jazzy",
-            "rolling",
-        ],
+        choices=ROS_DISTROS,
         help="ROS 2 distribution to install (e.g., 'iron', 'jazzy').",
     )
     install_parser.add_argument(
@@ -141,7 +120,8 @@ def main():
         default="${HOME}/ros2_jazzy",
         help=(
             "Path a ROS 2 source workspace directory where ROS 2 source"
-            "repositories should be cloned to when building ROS 2 from source."
+            "repositories should be cloned to when building ROS 2 from source. "
+            "(default: %(default)s)"
         ),
     )
     install_parser.add_argument(
@@ -149,12 +129,14 @@ def main():
         "--ros-source-ref",
         default="release-jazzy-20240523",
         help=(
-            "Branch or tag reference for ROS 2 source repositories.  "
+            "Branch or tag reference for ROS 2 source repositories. "
+            "(default: %(default)s)"
         ),
     )
     install_parser.add_argument(
         "-df",
         "--dependency-file",
+        action=DependencyFileAction,
         help=(
             "Dependency config file. Select from available configs or "
             "provide dependency config path."
@@ -167,37 +149,28 @@ def main():
         default="pipx",
         help=(
             "Method to install pip packages: 'user' installs with '--user', "
-            "'pipx' uses pipx, 'venv' uses a virtual environment."
+            "'pipx' uses pipx, 'venv' uses a virtual environment. "
+            "(default: %(default)s)"
         ),
     )
-    install_parser.set_defaults(func=InstallCommand)
 
-    ### 2. Config Command ###
-    config_parser = subparsers.add_parser(
-        "config",
-        description="Configure dotfiles, git hooks, etc.",
-        help="Configure dotfiles, git hooks, etc.",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-    )
-    # Command-specific arguments
+
+def _add_config_arguments(config_parser):
+    """Add the 'config' command arguments."""
     config_parser.add_argument(
         "-w",
         "--workspace",
+        type=_optional_path,
         help="ROS 2 workspace path.",
     )
-    config_parser.set_defaults(func=ConfigCommand)
 
-    ### 3. Setup Command ###
-    setup_parser = subparsers.add_parser(
-        "setup",
-        description="Set up ROS 2 workspaces using workspace configuration files.",
-        help="Set up ROS 2 workspaces using workspace configuration files.",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-    )
-    # Command-specific arguments
+
+def _add_setup_arguments(setup_parser):
+    """Add the 'setup' command arguments."""
     setup_parser.add_argument(
         "-wc",
         "--workspace-config",
+        action=WorkspaceConfigAction,
         help=(
             "Workspace config. Select from available configs or "
             "provide workspace config path."
@@ -206,6 +179,7 @@ def main():
     setup_parser.add_argument(
         "-w",
         "--workspace",
+        type=_optional_path,
         help="ROS 2 workspace path.",
     )
     setup_parser.add_argument(
@@ -230,7 +204,10 @@ def main():
         "--max-retries",
         type=int,
         default=2,
-        help="Set the maximum number of times vcs should retry commands on failure.",
+        help=(
+            "Set the maximum number of times vcs should retry commands on "
+            "failure. (default: %(default)s)"
+        ),
     )
     setup_parser.add_argument(
         "-t",
@@ -245,26 +222,22 @@ def main():
         "--host",
         type=str,
         default="github.com",
-        help="Git host site.",
+        help="Git host site. (default: %(default)s)",
     )
-    setup_parser.set_defaults(func=SetupCommand)
 
-    ### 4. Build Command ###
-    build_parser = subparsers.add_parser(
-        "build",
-        description="Build ROS 2 workspaces.",
-        help="Build ROS 2 workspaces.",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-    )
-    # Command-specific arguments
+
+def _add_build_arguments(build_parser):
+    """Add the 'build' command arguments."""
     build_parser.add_argument(
         "-w",
         "--workspace",
+        type=_optional_path,
         help="ROS 2 workspace path.",
     )
     build_parser.add_argument(
         "-u",
         "--underlay",
+        type=_optional_path,
         help="ROS 2 underlay path to use during build.",
     )
     build_parser.add_argument(
@@ -279,33 +252,283 @@ def main():
         action="store_true",
         help="Use symlinks instead of copying files where possible.",
     )
-    build_parser.set_defaults(func=BuildCommand)
 
-    ### 5. Update Command ###
-    update_parser = subparsers.add_parser(
-        "update",
-        description="Update ROS 2 workspace repositories.",
-        help="Update ROS 2 workspace repositories.",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-    )
-    # Command-specific arguments
+
+def _add_update_arguments(update_parser):
+    """Add the 'update' command arguments."""
     update_parser.add_argument(
         "-w",
         "--workspace",
+        type=_optional_path,
         help="ROS 2 workspace path.",
     )
-    update_parser.set_defaults(func=UpdateCommand)
+
+
+_SUBCOMMANDS = {
+    "install": (
+        "Install ROS 2, dependencies, etc.",
+        "Install ROS2, dependencies, etc.",
+        _add_install_arguments,
+    ),
+    "config": (
+        "Configure dotfiles, git hooks, etc.",
+        "Configure dotfiles, git hooks, etc.",
+        _add_config_arguments,
+    ),
+    "setup": (
+        "Set up ROS 2 workspaces using workspace configuration files.",
+        "Set up ROS 2 workspaces using workspace configuration files.",
+        _add_setup_arguments,
+    ),
+    "build": (
+        "Build ROS 2 workspaces.",
+        "Build ROS 2 workspaces.",
+        _add_build_arguments,
+    ),
+    "update": (
+        "Update ROS 2 workspace repositories.",
+        "Update ROS 2 workspace repositories.",
+        _add_update_arguments,
+    ),
+}
+
+# Global options that consume the following token as their value
+_GLOBAL_VALUE_OPTIONS = (
+    "-v",
+    "--verbosity",
+    "-lfp",
+    "--log-file-path",
+    "-lms",
+    "--log-max-size",
+    "-lbc",
+    "--log-backup-count",
+    "-bd",
+    "--backup-dir",
+    "-bkc",
+    "--backup-count",
+)
+
+
+# Single-character global flags that take no value and so may be clustered,
+# e.g. -yv debug
+_GLOBAL_FLAG_CHARS = "ydnh"
+
+
+def _classify_global_option(token):
+    """
+    Classify a global option token the way argparse will consume it.
+
+    Returns a `(is_help, takes_next)` tuple: whether the token requests help,
+    and whether it consumes the following token as its value.
+    """
+    if "=" in token:
+        return False, False
+    if token in ("-h", "--help"):
+        return True, False
+    if token in _GLOBAL_VALUE_OPTIONS:
+        return False, True
+    is_long = token.startswith("--")
+    # argparse accepts unambiguous prefixes of long and multi-character options
+    if len(token) > 2:
+        if is_long and "--help".startswith(token):
+            return True, False
+        if any(
+            option.startswith(token)
+            for option in _GLOBAL_VALUE_OPTIONS
+            if len(option) > 2 and option.startswith("--") == is_long
+        ):
+            return False, True
+    if is_long:
+        return False, False
+    # Clustered short flags: -v takes the rest of the cluster as its value,
+    # or the next token if it ends the cluster
+    for index, char in enumerate(token[1:], 1):
+        if char == "h":
+            return True, False
+        if char == "v":
+            return False, index == len(token) - 1
+        if char not in _GLOBAL_FLAG_CHARS:
+            break
+    return False, False
+
+
+def _sniff_subcommand(argv):
+    """
+    Find the subcommand named in `argv` without fully parsing it.
+
+    Returns None if no known subcommand is found, or if a help flag precedes
+    it, in which case every subcommand parser must be built.
+    """
+    skip_value = False
+    for token in argv:
+        if skip_value:
+            skip_value = False
+            continue
+        if token.startswith("-"):
+            is_help, skip_value = _classify_global_option(token)
+            if is_help:
+                return None
+            continue
+        return token if token in _SUBCOMMANDS else None
+    return None
+
+
+def _build_parser(command=None, populate_all=False):
+    """
+    Build the argument parser.
+
+    If `command` is given, only that subcommand's parser is constructed.
+    Otherwise, every subcommand parser is constructed without its arguments
+    (unless `populate_all` is set), which is enough to print the top-level
+    help or report a bad command.
+    """
+    # Create the top-level parser
+    parser = argparse.ArgumentParser(
+        description="CSUN ARCS Configurator",
+    )
+
+    # Global arguments
+    parser.add_argument(
+        "-v",
+        "--verbosity",
+        choices=_VERBOSITY_LEVELS,
+        default="info",
+        help="Set the logging verbosity level. (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-lfp",
+        "--log-file-path",
+        type=_optional_path,
+        default=None,
+        help=(
+            "Path to log file/directory. If None, system default location is "
+            "selected."
+        ),
+    )
+    parser.add_argument(
+        "-lms",
+        "--log-max-size",
+        type=int,
+        default=5 * 1024 * 1024,  # 5 MB
+        help=(
+            "Maximum log file size (in bytes) before rotation. "
+            "(default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "-lbc",
+        "--log-backup-count",
+        type=int,
+        default=5,
+        help="Number of backup log files to keep. (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-bd",
+        "--backup-dir",
+        type=str,
+        default=".arcscfg_backups",
+        help=(
+            "Directory name where backups will be stored relative to each "
+            "file's location. (default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "-bkc",
+        "--backup-count",
+        type=int,
+        default=50,
+        help="Number of backup copies to retain per file. (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-y",
+        "--yes",
+        "--assume-yes",
+        action="store_true",
+        help="Assume yes for all yes/no prompts and use default options otherwise.",
+    )
+    parser.add_argument(
+        "-d",
+        "--default",
+        "--assume-default",
+        action="store_true",
+        help="Assume default option for all prompts (overrides --assume-yes).",
+    )
+    parser.add_argument(
+        "-n",
+        "--no",
+        "--assume-no",
+        action="store_true",
+        help=("Assume no for all yes/no prompts and use default options otherwise "
+              "(overrides both --assume-yes and --assume-default)."),
+    )
+
+    # Create subparsers for commands
+    subparsers = parser.add_subparsers(
+        title="Commands",
+        dest="command",
+        description="Available commands",
+        help="Additional help",
+    )
+    subparsers.required = True  # Ensure that a command is provided
+
+    for name, (description, help_text, add_arguments) in _SUBCOMMANDS.items():
+        if command is not None and name != command:
+            continue
+        command_parser = subparsers.add_parser(
+            name,
+            description=description,
+            help=help_text,
+            formatter_class=_HelpFormatter,
+        )
+        # Without a known command, parsing can only end in the top-level help
+        # or a usage error, neither of which needs command-specific arguments
+        if command is not None or populate_all:
+            add_arguments(command_parser)
+
+    return parser
+
+
+def main():
+    if "_ARGCOMPLETE" in os.environ:
+        # Shell completion (argcomplete sets _ARGCOMPLETE when invoking us for
+        # a Tab press) inspects the whole parser tree rather than parsing a
+        # full command line, so every subcommand's arguments must be present
+        parser = _build_parser(populate_all=True)
+        try:
+            import argcomplete
+        except ImportError:
+            pass
+        else:
+            argcomplete.autocomplete(parser)
+    else:
+        command = _sniff_subcommand(sys.argv[1:])
+        # Should the sniff miss a command that is on the command line, fall
+        # back to the full parser rather than reject its arguments
+        populate_all = command is None and any(
+            token in _SUBCOMMANDS for token in sys.argv[1:]
+        )
+        parser = _build_parser(command, populate_all=populate_all)
 
     # Parse the arguments
     args = parser.parse_args()
 
-    # Initialize logger
-    logger = Logger(
-        verbosity=args.verbosity,
-        log_file_path=Path(args.log_file_path) if args.log_file_path else None,
-        max_bytes=args.log_max_size,
-        backup_count=args.log_backup_count,
-    )
+    # Resolve the selected command before setting up logging and backups
+    command_class = _load_command(args.command)
+
+    from arcscfg.utils.backer_upper import BackerUpper
+    from arcscfg.utils.logger import Logger, NullLogger
+    from arcscfg.utils.user_prompter import UserPrompter
+
+    # Initialize logger; silent runs only log if a log file was requested
+    if args.verbosity == "silent" and args.log_file_path is None:
+        logger = NullLogger()
+    else:
+        logger = Logger(
+            verbosity=args.verbosity,
+            log_file_path=args.log_file_path,
+            max_bytes=args.log_max_size,
+            backup_count=args.log_backup_count,
+        )
 
     # Initialize file backer-upper
     backer_upper = BackerUpper(
@@ -315,30 +538,22 @@ def main():
     )
 
     # Initialize user prompter
-    if args.no:
-        setattr(args, "assume", "no")
-        user_prompter = UserPrompter(assume="no")
-    elif args.default:
-        setattr(args, "assume", "default")
-        user_prompter = UserPrompter(assume="default")
-    elif args.yes:
-        setattr(args, "assume", "yes")
-        user_prompter = UserPrompter(assume="yes")
-    else:
-        setattr(args, "assume", None)
-        user_prompter = UserPrompter()
+    args.assume = next(
+        (assume for assume in _ASSUME_PRECEDENCE if getattr(args, assume)), None
+    )
+    if args.assume is None and (sys.stdin is None or not sys.stdin.isatty()):
+        # Nobody can answer prompts (stdin is closed or not a terminal), so
+        # take the defaults instead of blocking
+        logger.debug("stdin is not an interactive terminal, assuming default answers")
+        args.assume = "default"
+    user_prompter = UserPrompter(assume=args.assume)
 
     logger.info("Starting arcscfg tool")
 
     # Instantiate and execute the selected command
     try:
-        command_class = args.func
         command_instance = command_class(args, logger, backer_upper, user_prompter)
         command_instance.execute()
-    except AttributeError:
-        # This should not happen as subparsers are required
-        parser.print_help()
-        sys.exit(1)
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}")
         sys.exit(1)
@@ -1,5 +1,20 @@
-from .base import BaseCommand
-from .setup import SetupCommand
-from .install import InstallCommand
-from .build import BuildCommand
-from .update import UpdateCommand
+import importlib
+
+# Command classes are resolved on first access so that importing a single
+# command module does not drag in every other command's dependencies.
+_LAZY_ATTRS = {
+    "BaseCommand": ".base",
+    "SetupCommand": ".setup",
+    "InstallCommand": ".install",
+    "BuildCommand": ".build",
+    "UpdateCommand": ".update",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from arcscfg.utils.backer_upper import BackerUpper
-from arcscfg.utils.user_prompter import UserPrompter
+if TYPE_CHECKING:
+    from arcscfg.utils.backer_upper import BackerUpper
+    from arcscfg.utils.user_prompter import UserPrompter
 
 
 class BaseCommand(ABC):
@@ -10,15 +11,21 @@ class BaseCommand(ABC):
     Abstract base class for all commands.
     """
 
+    __slots__ = ("args", "logger", "backer_upper", "user_prompter")
+
     def __init__(self,
                args,
                logger,
-               backer_upper: Optional[BackerUpper] = None,
-               user_prompter: Optional[UserPrompter] = None
+               backer_upper: Optional["BackerUpper"] = None,
+               user_prompter: Optional["UserPrompter"] = None
                ):
         self.args = args
         self.logger = logger
         self.backer_upper = backer_upper
+        if user_prompter is None:
+            from arcscfg.utils.user_prompter import UserPrompter
+
+            user_prompter = UserPrompter(assume=getattr(args, "assume", None))
         self.user_prompter = user_prompter
 
     @abstractmethod
@@ -1,6 +1,3 @@
-from os import symlink
-from arcscfg.utils.workspace_manager import WorkspaceManager
-
 from .base import BaseCommand
 
 
@@ -9,9 +6,13 @@ class BuildCommand(BaseCommand):
     Handles the 'build' command.
     """
 
+    __slots__ = ()
+
     def execute(self):
         self.logger.debug("Executing BuildCommand")
 
+        from arcscfg.utils.workspace_manager import WorkspaceManager
+
         # Create a WorkspaceManager instance
         manager = WorkspaceManager(
             workspace_path=self.args.workspace,
@@ -23,6 +24,9 @@ class BuildCommand(BaseCommand):
             user_prompter=self.user_prompter,
         )
 
+        # Search for underlays while the workspace prompt is open
+        manager.prefetch_underlays()
+
         # Get or prompt for workspace path
         workspace_path = manager.get_or_prompt_workspace_path(
             allow_available=True,
@@ -1,7 +1,5 @@
 import sys
 
-from arcscfg.utils.dotfile_manager import DotfileManager
-
 from .base import BaseCommand
 
 
@@ -10,9 +8,13 @@ class ConfigCommand(BaseCommand):
     Handles the 'config' command.
     """
 
+    __slots__ = ()
+
     def execute(self):
         self.logger.debug("Executing ConfigCommand")
 
+        from arcscfg.utils.dotfile_manager import DotfileManager
+
         # Initialize DotfileManager
         dotfile_manager = DotfileManager(
             logger=self.logger,
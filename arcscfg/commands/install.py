@@ -1,19 +1,60 @@
+import os
 import sys
 from pathlib import Path
+from typing import Optional, Tuple
 
-from arcscfg.utils.dependency_manager import DependencyManager
+from arcscfg.constants import ROS_DISTROS
+from arcscfg.utils.paths import (
+    CONFIG_DIR,
+    PKG_ROOT,
+    absolute_user_path,
+    cached_isfile,
+    list_yaml_files,
+)
 
 from .base import BaseCommand
 
+# Kept as a string, as it is only used as a template substitution value
+_ARCSCFG_ROOT = str(PKG_ROOT.parent)
+_DEPENDENCIES_DIR = CONFIG_DIR / "dependencies"
+_DEPENDENCIES_DIR_STR = os.fspath(_DEPENDENCIES_DIR)
+
+_ROS_DISTRO_INDEX = {distro: index for index, distro in enumerate(ROS_DISTROS)}
+
+
+def resolve_dependencies_file(path_str) -> Optional[Path]:
+    """
+    Resolve a dependency file argument to an existing file.
+
+    The argument is tried as a path, then relative to config/dependencies,
+    then relative to config/dependencies with a .yaml or .yml extension.
+    Returns None if none of the candidates is a file.
+    """
+    path_str = os.fspath(path_str)
+    paths_to_try = (
+        os.path.expanduser(path_str),
+        os.path.join(_DEPENDENCIES_DIR_STR, path_str),
+        os.path.join(_DEPENDENCIES_DIR_STR, f"{path_str}.yaml"),
+        os.path.join(_DEPENDENCIES_DIR_STR, f"{path_str}.yml"),
+    )
+    for path in paths_to_try:
+        if cached_isfile(path):
+            return absolute_user_path(path)
+    return None
+
 
 class InstallCommand(BaseCommand):
     """
     Handles the 'install' command.
     """
 
+    __slots__ = ()
+
     def execute(self):
         self.logger.debug("Executing InstallCommand")
 
+        from arcscfg.utils.dependency_manager import DependencyManager
+
         # Initialize DependencyManager
         dep_manager = DependencyManager(
             dependencies_file=None,
@@ -21,71 +62,69 @@ class InstallCommand(BaseCommand):
             assume=self.args.assume,
             pip_install_method=self.args.pip_install_method or "user",
             context={
-                "ARCSCFG_ROOT": str(Path(__file__).parent.parent.parent.resolve()),
+                "ARCSCFG_ROOT": _ARCSCFG_ROOT,
                 "ARCSCFG_ROS_DISTRO": self.args.ros_distro,
                 "ARCSCFG_ROS_SOURCE_WORKSPACE_PATH": self.args.ros_source_workspace_path,
                 "ARCSCFG_ROS_SOURCE_REF": self.args.ros_source_ref,
             },
         )
 
+        # Decide on both stages up front so the distro is resolved only once
+        install_ros2 = self.args.install_ros2 or self.user_prompter.prompt_yes_no(
+            "Install ROS 2?", default=False
+        )
+        install_deps = self.args.install_deps or self.user_prompter.prompt_yes_no(
+            "Install dependencies?", default=False
+        )
+        # The context already carries a valid --ros-distro, so only a
+        # missing or unknown one needs prompting and re-substituting
+        if (install_ros2 or install_deps) and self.args.ros_distro not in _ROS_DISTRO_INDEX:
+            self.args.ros_distro = self._get_or_prompt_ros_distro()
+            dep_manager.context["ARCSCFG_ROS_DISTRO"] = self.args.ros_distro
+
         # Handle ROS 2 installation
-        try:
-            if self.args.install_ros2 or self.user_prompter.prompt_yes_no("Install ROS 2?", default=False):
-                self.args.ros_distro = self._get_or_prompt_ros_distro()
-                dep_manager.context["ARCSCFG_ROS_DISTRO"] = self.args.ros_distro
+        if install_ros2:
+            try:
                 dep_manager.install_ros2()
-        except Exception as e:
-            self.logger.error(f"An error occurred during ROS 2 installation: {e}")
-            sys.exit(1)
+            except Exception as e:
+                self.logger.error(f"An error occurred during ROS 2 installation: {e}")
+                sys.exit(1)
 
         # Handle dependencies installation
-        try:
-            if self.args.install_deps or self.user_prompter.prompt_yes_no("Install dependencies?", default=False):
-                self.args.ros_distro = self._get_or_prompt_ros_distro()
-                dep_manager.context["ARCSCFG_ROS_DISTRO"] = self.args.ros_distro
+        if install_deps:
+            try:
                 dep_manager.dependencies_file = self._get_or_prompt_dependencies_file()
                 self.logger.info(f"Installing dependencies from '{dep_manager.dependencies_file}'...")
                 dep_manager.install_dependencies()
                 self.logger.info("Dependencies installed successfully.")
-        except Exception as e:
-            self.logger.error(f"An error occurred during dependency installation: {e}")
-            sys.exit(1)
+            except Exception as e:
+                self.logger.error(f"An error occurred during dependency installation: {e}")
+                sys.exit(1)
 
     def _get_or_prompt_ros_distro(self) -> str:
         """Handle ROS distribution selection with UserPrompter"""
-        available_distros = [
-            "ardent",
-            "bouncy",
-            "crystal",
-            "dashing",
-            "eloquent",
-            "foxy",
-            "galactic",
-            "humble",
-            "iron",
-            "jazzy",
-            "rolling",
-        ]
-
-        if self.args.ros_distro and self.args.ros_distro in available_distros:
+        if self.args.ros_distro in _ROS_DISTRO_INDEX:
             return self.args.ros_distro
 
         selection = self.user_prompter.prompt_selection(
             message="Select a ROS 2 distribution:",
-            options=available_distros,
-            default=available_distros.index("jazzy") + 1,  # 1-based index for display
+            options=list(ROS_DISTROS),
+            default=_ROS_DISTRO_INDEX["jazzy"] + 1,  # 1-based index for display
         )
 
-        return available_distros[selection]
+        return ROS_DISTROS[selection]
 
     def _get_or_prompt_dependencies_file(self) -> Path:
         """Get dependency file path through UserPrompter"""
         if self.args.dependency_file:
-            dep_file = self._resolve_dependencies_file(self.args.dependency_file)
-            if dep_file.is_file():
+            # Already resolved when parsed by the CLI; the probe is cached
+            dep_file = resolve_dependencies_file(self.args.dependency_file)
+            if dep_file:
                 return dep_file
 
-            self.logger.error(f"Dependencies file not found: {dep_file}")
+            self.logger.error(
+                f"Dependencies file not found: {self.args.dependency_file}"
+            )
             if self.args.yes:
                 sys.exit(1)
 
@@ -99,9 +138,13 @@ class InstallCommand(BaseCommand):
             self.logger.error("No dependency config files available!")
             sys.exit(1)
 
+        # The menu default is the first file, so skip building the menu
+        if self.user_prompter.assume:
+            self.logger.debug("Assuming default dependency config: %s", available_files[0])
+            return available_files[0]
+
         # Prompt for selection
-        options = [f"{f.stem} ('{f}')" for f in available_files]
-        options.append("Enter custom path")
+        options = [f"{f.stem} ('{f}')" for f in available_files] + ["Enter custom path"]
 
         selection = self.user_prompter.prompt_selection(
             message="Available dependency configurations:",
@@ -116,28 +159,14 @@ class InstallCommand(BaseCommand):
         custom_path = self.user_prompter.prompt_input(
             "Enter path to custom dependencies file"
         )
-        custom_path = Path(custom_path).expanduser().resolve()
+        custom_path = absolute_user_path(custom_path)
 
-        if not custom_path.exists():
+        if not cached_isfile(os.fspath(custom_path)):
             self.logger.error(f"File not found: {custom_path}")
             sys.exit(1)
 
         return custom_path
 
-    def _resolve_dependencies_file(self, path_str: str) -> Path:
-        """Resolve dependency file path"""
-        paths_to_try = [
-            Path(path_str).expanduser().resolve(),
-            Path(__file__).parent.parent / "config/dependencies" / path_str,
-            Path(__file__).parent.parent / "config/dependencies" / f"{path_str}.yaml",
-        ]
-
-        for path in paths_to_try:
-            if path.exists():
-                return path
-        return Path(path_str)
-
-    def _get_available_dependencies_files(self) -> list[Path]:
-        """Get list of available dependency config files"""
-        deps_dir = Path(__file__).parent.parent / "config/dependencies"
-        return list(deps_dir.glob("*.yaml"))
+    def _get_available_dependencies_files(self) -> Tuple[Path, ...]:
+        """Get available dependency config files"""
+        return list_yaml_files(_DEPENDENCIES_DIR_STR)
@@ -1,32 +1,37 @@
 import sys
 
-from arcscfg.utils.workspace_manager import WorkspaceManager
-
 from .base import BaseCommand
 
+# Default dependency file names and clone URL prefix template per transport
+_TRANSPORTS = {
+    "ssh": (("dependencies.repos.ssh", "dependencies.rosinstall.ssh"), "git@{host}:"),
+    "https": (
+        ("dependencies.repos.https", "dependencies.rosinstall.https"),
+        "https://{host}/",
+    ),
+}
+_DEFAULT_TRANSPORT = (("dependencies.repos", "dependencies.rosinstall"), "git@{host}:")
+
 
 class SetupCommand(BaseCommand):
     """
     Handles the 'setup' command.
     """
 
+    __slots__ = ()
+
     def execute(self):
         self.logger.debug("Executing SetupCommand")
 
-        package_dependency_files = self.args.package_dependency_files
+        from arcscfg.utils.workspace_manager import WorkspaceManager
 
-        if self.args.transport.lower() == "ssh":
-            if not package_dependency_files:
-                package_dependency_files = ["dependencies.repos.ssh", "dependencies.rosinstall.ssh"]
-            clone_url_prefix = "git@" + self.args.host + ":"
-        elif self.args.transport.lower() == "https":
-            if not package_dependency_files:
-                package_dependency_files = ["dependencies.repos.https", "dependencies.rosinstall.https"]
-            clone_url_prefix = "https://" + self.args.host + "/"
-        else:
-            if not package_dependency_files:
-                package_dependency_files = ["dependencies.repos", "dependencies.rosinstall"]
-            clone_url_prefix = "git@" + self.args.host + ":"
+        default_dependency_files, clone_url_template = _TRANSPORTS.get(
+            self.args.transport.lower(), _DEFAULT_TRANSPORT
+        )
+        package_dependency_files = (
+            self.args.package_dependency_files or list(default_dependency_files)
+        )
+        clone_url_prefix = clone_url_template.format(host=self.args.host)
 
         # Initialize WorkspaceManager
         manager = WorkspaceManager(
@@ -50,8 +55,12 @@ class SetupCommand(BaseCommand):
             sys.exit(1)
         manager.workspace_config = workspace_config
 
-        # Get or prompt for workspace path
-        default_workspace_path = manager.infer_default_workspace_path(workspace_config)
+        # Get or prompt for workspace path; a default is only needed to prompt
+        default_workspace_path = (
+            None
+            if manager.workspace_path
+            else manager.infer_default_workspace_path(workspace_config)
+        )
         workspace_path = manager.get_or_prompt_workspace_path(
             default_workspace=default_workspace_path,
             allow_available=False,
@@ -1,7 +1,4 @@
 import sys
-from pathlib import Path
-
-from arcscfg.utils.workspace_manager import WorkspaceManager
 
 from .base import BaseCommand
 
@@ -11,21 +8,31 @@ class UpdateCommand(BaseCommand):
     Handles the 'update' command.
     """
 
+    __slots__ = ()
+
     def execute(self):
         self.logger.debug("Executing UpdateCommand")
 
-        workspace_path = self._get_workspace_path()
-        if not workspace_path:
-            self.logger.error("Workspace path could not be determined.")
-            sys.exit(1)
+        from arcscfg.utils.workspace_manager import WorkspaceManager
 
         manager = WorkspaceManager(
-            workspace_path=str(workspace_path),
+            workspace_path=self.args.workspace,
             workspace_config=None,
             assume=self.args.assume,
             logger=self.logger,
+            user_prompter=self.user_prompter,
         )
 
+        # Get or prompt for workspace path
+        workspace_path = manager.get_or_prompt_workspace_path(
+            allow_available=True,
+            allow_create=False,
+        )
+        if not workspace_path:
+            self.logger.error("Workspace path could not be determined.")
+            sys.exit(1)
+        manager.workspace_path = workspace_path
+
         try:
             self.logger.info(f"Updating workspace at '{workspace_path}'")
             manager.update_workspace()
@@ -33,27 +40,3 @@ class UpdateCommand(BaseCommand):
         except Exception as e:
             self.logger.error(f"An error occurred during update: {e}")
             sys.exit(1)
-
-    def _get_workspace_path(self) -> Path:
-        """
-        Get the workspace path from arguments or prompt the user.
-        """
-        if self.args.workspace:
-            workspace_path = Path(self.args.workspace).expanduser().resolve()
-            self.logger.debug(f"Using provided workspace path: {workspace_path}")
-            return workspace_path
-        else:
-            manager = WorkspaceManager(
-                workspace_path=None,
-                workspace_config=None,
-                assume=self.args.assume,
-                logger=self.logger,
-            )
-            workspace_path = manager._prompt_for_workspace(
-                default_workspace=None,
-                allow_available=True,
-                allow_create=False,
-            )
-            if workspace_path:
-                self.logger.debug(f"User selected workspace path: {workspace_path}")
-            return workspace_path
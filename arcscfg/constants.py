@@ -0,0 +1,17 @@
+# Constants shared by the CLI and the commands. Keep this module free of
+# imports so that the entry point can use it at no startup cost.
+
+# Supported ROS 2 distributions, oldest first
+ROS_DISTROS = (
+    "ardent",
+    "bouncy",
+    "crystal",
+    "dashing",
+    "eloquent",
+    "foxy",
+    "galactic",
+    "humble",
+    "iron",
+    "jazzy",
+    "rolling",
+)
@@ -1,15 +1,30 @@
+import os
 import shutil
+import time
 from pathlib import Path
 from typing import Optional
 
 from .logger import Logger
 
+# Backup suffixes below this are rotation indices from the old numbered
+# scheme (<name>.1 newest) rather than time.time_ns() timestamps
+_TIMESTAMP_MIN = 10 ** 18
+
+
+def _backup_age_key(suffix: str):
+    """Sort key ordering backup suffixes from oldest to newest."""
+    value = int(suffix)
+    if value < _TIMESTAMP_MIN:
+        # Numbered backups predate every timestamped one, highest index first
+        return (0, -value)
+    return (1, value)
+
 
 class BackerUpper:
     """
     A utility class for backing up files. It manages backup copies of specified files
-    by storing them in a designated backup directory and maintaining a fixed number
-    of backups using a rotation mechanism similar to RotatingFileHandler.
+    by storing them as timestamped copies in a designated backup directory and
+    pruning the oldest ones beyond a fixed number of backups.
 
     Example Usage:
         backer_upper = BackerUpper(backup_dir=".arcscfg_backups", backup_count=5)
@@ -29,6 +44,7 @@ class BackerUpper:
             backup_dir (str): Name of the backup directory to store backups.
                               This directory will be created inside the original file's directory.
             backup_count (int): Maximum number of backups to retain per file.
+                                The backup just written is always kept.
             logger (Logger, optional): An instance of the Logger class for logging.
                                        If not provided, a default Logger is initialized.
         """
@@ -57,32 +73,43 @@ class BackerUpper:
         backup_dir.mkdir(parents=True, exist_ok=True)
         self.logger.debug(f"Backup directory set to: {backup_dir}")
 
-        backup_base = backup_dir / file_path.name
-
-        # Rotate existing backups
-        for i in range(self.backup_count, 0, -1):
-            src = backup_base.with_suffix(f"{file_path.suffix}.{i}")
-            dst = backup_base.with_suffix(f"{file_path.suffix}.{i + 1}")
-            if src.exists():
-                if i == self.backup_count:
-                    self.logger.debug(f"Removing oldest backup: {src}")
-                    try:
-                        src.unlink()
-                        self.logger.debug(f"Deleted old backup: {src}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to delete {src}: {e}")
-                else:
-                    self.logger.debug(f"Renaming backup {src} to {dst}")
-                    try:
-                        src.rename(dst)
-                        self.logger.debug(f"Rotated backup: {src} -> {dst}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to rotate {src} to {dst}: {e}")
-
-        # Create new backup (.1)
-        new_backup = backup_base.with_suffix(f"{file_path.suffix}.1")
+        # time_ns() can repeat within one clock tick, so create the backup
+        # exclusively and move to the next suffix if the name is taken
+        stamp = time.time_ns()
         try:
-            shutil.copy2(file_path, new_backup)
+            while True:
+                new_backup = backup_dir / f"{file_path.name}.{stamp}"
+                try:
+                    with open(file_path, "rb") as src, open(new_backup, "xb") as dst:
+                        shutil.copyfileobj(src, dst)
+                    break
+                except FileExistsError:
+                    stamp += 1
+            shutil.copystat(file_path, new_backup)
             self.logger.debug(f"Created backup: {new_backup}")
         except Exception as e:
             self.logger.error(f"Failed to backup {file_path} to {new_backup}: {e}")
+            return
+
+        # Prune the oldest backups of this file. The new backup is never a
+        # candidate, as a clock that stepped backwards would sort it oldest.
+        keep = max(self.backup_count, 1)
+        prefix = f"{file_path.name}."
+        with os.scandir(backup_dir) as it:
+            backups = [
+                entry
+                for entry in it
+                if entry.name.startswith(prefix)
+                and entry.name[len(prefix):].isdigit()
+                and entry.name != new_backup.name
+            ]
+        excess = len(backups) + 1 - keep
+        if excess <= 0:
+            return
+        backups.sort(key=lambda entry: _backup_age_key(entry.name[len(prefix):]))
+        for entry in backups[:excess]:
+            try:
+                os.unlink(entry.path)
+                self.logger.debug(f"Deleted old backup: {entry.path}")
+            except OSError as e:
+                self.logger.error(f"Failed to delete {entry.path}: {e}")
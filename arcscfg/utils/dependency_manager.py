@@ -1,17 +1,35 @@
+import functools
+import os
 import sys
 import yaml
 import subprocess
-import platform
 from pathlib import Path
 from string import Template
 from typing import Any, Dict, List, Optional, Union
 
 from arcscfg.utils.user_prompter import UserPrompter
-from arcscfg.utils.script_executor import ScriptExecutor
 
 from .logger import Logger
+from .paths import CONFIG_DIR, list_yaml_files
 from .shell import Shell
 
+_SCRIPTS_DIR = CONFIG_DIR / "scripts"
+
+# Parsed dependency files keyed on (path, mtime_ns, size, context items).
+# Callers only read the parsed data, so cache hits share the same object.
+_DEPENDENCIES_CACHE = {}  # type: Dict[tuple, Any]
+
+
+@functools.lru_cache(maxsize=1)
+def _os_name() -> str:
+    """Host OS name as used in the install script file names."""
+    if sys.platform == "darwin":
+        return "macos"
+    if sys.platform.startswith("linux"):
+        # Ubuntu kernels carry the distribution name in their version string
+        return "ubuntu" if "ubuntu" in os.uname().version.lower() else "linux"
+    return sys.platform
+
 
 class DependencyManager:
     def __init__(
@@ -39,13 +57,30 @@ class DependencyManager:
         if not self.dependencies_file:
             self.logger.error("No dependencies file provided.")
             raise ValueError("Dependencies file not set.")
-        if not self.dependencies_file.exists():
+        try:
+            st = os.stat(self.dependencies_file)
+        except FileNotFoundError:
             self.logger.error(
                 f"Dependencies file does not exist: {self.dependencies_file}"
             )
             raise FileNotFoundError(
                 f"Dependencies file not found: {self.dependencies_file}"
             )
+
+        # The parsed result depends on both the file contents and the
+        # substitution context, so both go into the cache key
+        cache_key = (
+            os.fspath(self.dependencies_file),
+            st.st_mtime_ns,
+            st.st_size,
+            tuple(sorted(self.context.items())),
+        )
+        cached = _DEPENDENCIES_CACHE.get(cache_key)
+        if cached is not None:
+            self.dependencies = cached
+            self.logger.debug("Reusing parsed dependencies for %s", cache_key[0])
+            return
+
         with self.dependencies_file.open("r") as f:
             raw_content = f.read()
 
@@ -58,8 +93,9 @@ class DependencyManager:
             raise
 
         self.dependencies = yaml.safe_load(substituted_content)
+        _DEPENDENCIES_CACHE[cache_key] = self.dependencies
         self.logger.debug(
-            f"Loaded dependencies after substitution: {self.dependencies}"
+            "Loaded dependencies after substitution: %s", self.dependencies
         )
 
     def install_dependencies(self):
@@ -192,15 +228,7 @@ class DependencyManager:
     def install_ros2(self):
         """Install given ROS 2 distro using available OS-specific install scripts"""
         # Determine available scripts based on OS and ROS distro
-        if platform.system().lower() == "darwin":
-            os_name = "macos"
-        elif platform.system().lower() == "linux":
-            if "ubuntu" in platform.uname().version.lower():
-                os_name = "ubuntu"
-            else:
-                os_name = "linux"
-        else:
-            os_name = sys.platform
+        os_name = _os_name()
 
         # Get the desired ros distribution from the context
         ros_distro = self.context["ARCSCFG_ROS_DISTRO"]
@@ -215,6 +243,8 @@ class DependencyManager:
         script_path = self._prompt_script_selection(scripts)
 
         # Execute the selected script
+        from arcscfg.utils.script_executor import ScriptExecutor
+
         executor = ScriptExecutor(script_path, self.logger, self.user_prompter, self.context)
         try:
             executor.execute()
@@ -224,9 +254,12 @@ class DependencyManager:
 
     def _get_available_ros_install_scripts(self, os_name: str, ros_distro: str) -> List[Path]:
         """Get available ROS 2 install scripts for given OS/ROS distro"""
-        scripts_dir = Path(__file__).parent.parent / 'config' / 'scripts'
-        pattern = f"install_ros2_{ros_distro}_{os_name}_*.yaml"
-        return list(scripts_dir.glob(pattern))
+        prefix = f"install_ros2_{ros_distro}_{os_name}_"
+        return [
+            script
+            for script in list_yaml_files(os.fspath(_SCRIPTS_DIR))
+            if script.name.startswith(prefix) and script.name.endswith(".yaml")
+        ]
 
     def _prompt_script_selection(self, scripts: List[Path]) -> Path:
         """Prompt user for install script given list of script paths"""
@@ -6,8 +6,10 @@ from typing import Optional
 
 from arcscfg.utils.backer_upper import BackerUpper
 from arcscfg.utils.logger import Logger
+from arcscfg.utils.paths import CONFIG_DIR, resolve_user_path, user_home
 from arcscfg.utils.user_prompter import UserPrompter
-from arcscfg.utils.workspace_manager import WorkspaceManager
+
+_DOTFILES_DIR = CONFIG_DIR / "dotfiles"
 
 
 class DotfileManager:
@@ -22,11 +24,13 @@ class DotfileManager:
         self.logger = logger or Logger()
         self.backer_upper = backer_upper or BackerUpper()
         self.workspace_path = workspace_path
+        # Set once the workspace path has been expanded and resolved
+        self._workspace_path_resolved = False
         self.assume = assume
         self.user_prompter = user_prompter or UserPrompter(assume=assume)
 
         # Paths to the dotfiles and githooks directories
-        self.dotfiles_dir = Path(__file__).parent.parent / "config" / "dotfiles"
+        self.dotfiles_dir = _DOTFILES_DIR
         self.githooks_dir = self.dotfiles_dir / "githooks"
 
         # Collect dotfile templates present in the dotfiles directory
@@ -40,9 +44,9 @@ class DotfileManager:
         self.context = {
             "ARCSCFG_START_BLOCK": "# >>> arcscfg >>>",
             "ARCSCFG_END_BLOCK": "# <<< arcscfg <<<",
-            "ARCSCFG_BASHRC_DIR": str((self.dotfiles_dir / "bashrc").resolve()),
-            "ARCSCFG_ZSHRC_DIR": str((self.dotfiles_dir / "zshrc").resolve()),
-            "ARCSCFG_GITHOOKS_PATH": str(self.githooks_dir.resolve()),
+            "ARCSCFG_BASHRC_DIR": str(self.dotfiles_dir / "bashrc"),
+            "ARCSCFG_ZSHRC_DIR": str(self.dotfiles_dir / "zshrc"),
+            "ARCSCFG_GITHOOKS_PATH": str(self.githooks_dir),
             "ARCSCFG_SOURCE_WOKSPACE": "",
             # Add more variables as needed
         }
@@ -52,9 +56,10 @@ class DotfileManager:
         Configure dotfiles with their respective handlers.
         """
         self.logger.info("Configuring dotfiles...")
+        home_dir = user_home()
         for dotfile in self.dotfiles:
             src = self.dotfiles_dir / dotfile
-            dst = Path.home() / dotfile
+            dst = home_dir / dotfile
 
             # Prompt the user using UserPrompter
             if self.user_prompter.prompt_yes_no(f"Update {dst}?", default=False):
@@ -154,7 +159,7 @@ class DotfileManager:
         """
         src = self.dotfiles_dir / ".gitconfig"
         if mode == "global":
-            dst = Path.home() / ".gitconfig"
+            dst = user_home() / ".gitconfig"
             self.logger.info("Configuring Git globally.")
             self._handle_gitconfig(src, dst)
         elif mode == "local":
@@ -188,7 +193,7 @@ class DotfileManager:
             "bash": "setup.bash",
             "zsh": "setup.zsh",
         }
-        shell_rc_file = Path.home() / shell_rc_map.get(shell, ".bashrc")
+        shell_rc_file = user_home() / shell_rc_map.get(shell, ".bashrc")
         template_name = shell_rc_file.name
 
         # Prompt the user for workspace sourcing
@@ -237,10 +242,14 @@ class DotfileManager:
         """
         Resolve a given workspace path or get it by prompting the user.
         """
+        if self._workspace_path_resolved:
+            return
         if self.workspace_path:
-            self.workspace_path = Path(self.workspace_path).expanduser().resolve()
+            self.workspace_path = resolve_user_path(os.fspath(self.workspace_path))
             self.logger.debug(f"Using provided workspace path: {self.workspace_path}")
         else:
+            from arcscfg.utils.workspace_manager import WorkspaceManager
+
             manager = WorkspaceManager(
                 workspace_path=None,
                 workspace_config=None,
@@ -248,8 +257,7 @@ class DotfileManager:
                 logger=self.logger,
                 user_prompter=self.user_prompter,
             )
-            self.workspace_path = manager._prompt_for_workspace(
-                default_workspace=None,
+            self.workspace_path = manager.get_or_prompt_workspace_path(
                 allow_available=True,
                 allow_create=False,
             )
@@ -257,6 +265,8 @@ class DotfileManager:
                 self.logger.debug(
                     f"User selected workspace path: {self.workspace_path}"
                 )
+        # Both branches leave a resolved path; later calls can reuse it
+        self._workspace_path_resolved = self.workspace_path is not None
 
     def run_all(self):
         """
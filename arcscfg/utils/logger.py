@@ -192,3 +192,26 @@ class Logger:
         `self._logger.info(...)`.
         """
         return getattr(self._logger, name)
+
+
+class NullLogger:
+    """A logger that discards every record. Used for silent runs without an
+    explicit log file, so that no console handler or log file is set up."""
+
+    def __init__(self, project_name: str = "arcscfg"):
+        """
+        Args:
+            project_name (str): Name of the underlying `logging.Logger`.
+        """
+        self._logger = logging.getLogger(project_name)
+        self._logger.handlers.clear()
+        self._logger.addHandler(logging.NullHandler())
+        # Beyond CRITICAL, so records are dropped before they are created
+        self._logger.setLevel(logging.CRITICAL + 10)
+        self._logger.propagate = False
+
+    def __getattr__(self, name: str):
+        """
+        Delegate attribute access to the underlying `logging.Logger`.
+        """
+        return getattr(self._logger, name)
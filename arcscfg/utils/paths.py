@@ -0,0 +1,54 @@
+import functools
+import os
+import stat
+from pathlib import Path
+from typing import Tuple
+
+# Package root, located once at import time
+PKG_ROOT = Path(__file__).resolve().parent.parent
+
+# Bundled configuration shipped inside the arcscfg package
+CONFIG_DIR = PKG_ROOT / "config"
+
+
+@functools.lru_cache(maxsize=1)
+def user_home() -> Path:
+    """The user's home directory, looked up once per process."""
+    return Path.home()
+
+
+@functools.lru_cache(maxsize=128)
+def resolve_user_path(path: str) -> Path:
+    """Expand and resolve a user-supplied path, once per distinct input."""
+    return Path(path).expanduser().resolve()
+
+
+def absolute_user_path(path: str) -> Path:
+    """
+    Expand `~` and make a user-supplied path absolute without resolving
+    symlinks, so no filesystem calls are made.
+    """
+    return Path(os.path.abspath(os.path.expanduser(path)))
+
+
+@functools.lru_cache(maxsize=None)
+def cached_isfile(path: str) -> bool:
+    """
+    Whether `path` is a regular file, probed with a single stat. Hits and
+    misses are both remembered for the rest of the process.
+    """
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+@functools.lru_cache(maxsize=8)
+def list_yaml_files(directory: str) -> Tuple[Path, ...]:
+    """List the YAML files in a directory, once per process."""
+    with os.scandir(directory) as entries:
+        return tuple(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith((".yaml", ".yml")) and entry.is_file()
+        )
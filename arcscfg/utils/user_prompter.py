@@ -1,3 +1,4 @@
+import sys
 from typing import Dict, List, Optional
 
 
@@ -9,7 +10,9 @@ class UserPrompter:
         Args:
             assume Optional[str]: If 'yes', automatically assume 'Yes' for all
             yes/no prompts and default options otherwise.  If 'default',
-            automatically assume default responses for all prompts.
+            automatically assume default responses for all prompts.  If
+            'no', automatically assume 'No' for all yes/no prompts and
+            default options otherwise.
         """
         self.assume = assume
 
@@ -57,15 +60,17 @@ class UserPrompter:
         Returns:
             int: The index of the selected option (0-based).
         """
-        if self.assume == "yes" or self.assume == "default":
+        if self.assume in ("yes", "default", "no"):
             if default is not None:
                 return default - 1
             else:
                 return 0  # Default to first option
 
-        print(message)
-        for idx, option in enumerate(options, start=1):
-            print(f"{idx}: {option}")
+        # Write the whole menu at once rather than one line at a time
+        menu = "\n".join(
+            f"{idx}: {option}" for idx, option in enumerate(options, start=1)
+        )
+        sys.stdout.write(f"{message}\n{menu}\n")
 
         if default is not None:
             prompt = f"Select an option [default: {default}]: "
@@ -107,7 +112,7 @@ class UserPrompter:
         Returns:
             str: The user's input or the default value.
         """
-        if (self.assume == "yes" or self.assume == "default") and default is not None:
+        if self.assume in ("yes", "default", "no") and default is not None:
             return default
 
         if options:
@@ -1,17 +1,81 @@
+import fnmatch
+import functools
 import os
 import re
+import stat
 import subprocess
 import sys
 from string import Template
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Sequence, Tuple
 
 import yaml
 
 from arcscfg.utils.logger import Logger
+from arcscfg.utils.paths import (
+    CONFIG_DIR,
+    absolute_user_path,
+    cached_isfile,
+    list_yaml_files,
+    resolve_user_path,
+    user_home,
+)
 from arcscfg.utils.shell import Shell
 from arcscfg.utils.user_prompter import UserPrompter
-from arcscfg.utils.script_executor import ScriptExecutor
+
+_WORKSPACES_DIR = CONFIG_DIR / "workspaces"
+# String form for the resolver, which probes candidates with os.path
+_WORKSPACES_DIR_STR = os.fspath(_WORKSPACES_DIR)
+_SCRIPTS_DIR = CONFIG_DIR / "scripts"
+
+# Directory name patterns of workspaces discovered in the home dir
+_WORKSPACE_PATTERNS = ("*_ws", "ros2_*")
+
+# Workspace discovery results keyed by (home_dir, naming_patterns), shared by
+# every WorkspaceManager so that repeated prompts do not rescan the home dir
+_available_workspaces_cache: Dict[Tuple[Path, Tuple[str, ...]], Tuple[Path, ...]] = {}
+
+
+def list_workspace_configs() -> Tuple[Path, ...]:
+    """List the bundled workspace configuration files."""
+    return list_yaml_files(_WORKSPACES_DIR_STR)
+
+
+def list_build_scripts() -> Tuple[Path, ...]:
+    """List the bundled workspace build scripts."""
+    return tuple(
+        script
+        for script in list_yaml_files(os.fspath(_SCRIPTS_DIR))
+        if script.name.startswith("build_")
+    )
+
+
+def resolve_workspace_config(workspace_config) -> Optional[Path]:
+    """
+    Resolve a workspace config argument to an existing file.
+
+    The argument is tried as a path, then relative to config/workspaces,
+    then relative to config/workspaces with a .yaml or .yml extension.
+    Arguments that are clearly paths are only tried as a path. Returns None if
+    none of the candidates exist.
+    """
+    workspace_config = os.fspath(workspace_config)
+    if not workspace_config:
+        return None
+    if os.sep in workspace_config or workspace_config.startswith("~"):
+        # An explicit path cannot name a file inside config/workspaces
+        candidates = (os.path.expanduser(workspace_config),)
+    else:
+        candidates = (
+            workspace_config,
+            os.path.join(_WORKSPACES_DIR_STR, workspace_config),
+            os.path.join(_WORKSPACES_DIR_STR, f"{workspace_config}.yaml"),
+            os.path.join(_WORKSPACES_DIR_STR, f"{workspace_config}.yml"),
+        )
+    for candidate in candidates:
+        if cached_isfile(candidate):
+            return absolute_user_path(candidate)
+    return None
 
 
 class WorkspaceManager:
@@ -34,11 +98,11 @@ class WorkspaceManager:
         self.assume = assume
 
         self.workspace_path = (
-            Path(workspace_path).expanduser().resolve() if workspace_path else None
+            resolve_user_path(os.fspath(workspace_path)) if workspace_path else None
         )
         self.workspace_config = workspace_config
         self.underlay_path = (
-            Path(underlay_path).expanduser().resolve() if underlay_path else None
+            resolve_user_path(os.fspath(underlay_path)) if underlay_path else None
         )
         self.build_script_path = build_script_path
         self.symlink_install = symlink_install
@@ -53,6 +117,8 @@ class WorkspaceManager:
         self.max_retries = max_retries
         self.context = context or {}
         self.user_prompter = user_prompter or UserPrompter(assume=assume)
+        # Background underlay search started by prefetch_underlays()
+        self._underlays_future = None
 
     def _discover_dependency_files(self) -> List[Path]:
         """Discover all dependency files within each cloned repository in the workspace."""
@@ -138,7 +204,7 @@ class WorkspaceManager:
             substituted_config = yaml.safe_load(substituted_content)
 
             # Write substituted config to temp file
-            temp_config = Path("/tmp") / os.path.basename(self.workspace_config)
+            temp_config = Path("/tmp") / Path(self.workspace_config).name
             with open(temp_config, "w") as f:
                 yaml.safe_dump(substituted_config, f, sort_keys=False)
 
@@ -219,6 +285,9 @@ class WorkspaceManager:
 
             symlink_install_arg = "--symlink-install" if self.symlink_install else ""
 
+            # Only building needs the script executor
+            from arcscfg.utils.script_executor import ScriptExecutor
+
             # Proceed with build
             self.logger.info(f"Building workspace at '{workspace}' using build script {build_script}...")
             executor = ScriptExecutor(build_script, self.logger, self.user_prompter,
@@ -307,6 +376,7 @@ class WorkspaceManager:
         return src_dir
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def infer_default_workspace_path(workspace_config: Path) -> Path:
         """
         Infer a default workspace path based on the workspace config.
@@ -315,7 +385,7 @@ class WorkspaceManager:
         """
         config_name = workspace_config.stem
         suggested_name = f"{config_name}_ws"
-        default_workspace = Path.home() / suggested_name
+        default_workspace = user_home() / suggested_name
         return default_workspace
 
     def get_workspace_setup_file(self, workspace_path: Path) -> Optional[Path]:
@@ -341,7 +411,7 @@ class WorkspaceManager:
         setup_file_name = setup_files.get(shell_name, "setup.bash")
 
         self.logger.debug(
-            f"Detected shell: {shell_name}, looking for '{setup_file_name}'"
+            "Detected shell: %s, looking for '%s'", shell_name, setup_file_name
         )
 
         # Possible setup file locations
@@ -357,7 +427,7 @@ class WorkspaceManager:
         # Try each possible path
         for path in possible_paths:
             if path.exists():
-                self.logger.debug(f"Found setup file: {path}")
+                self.logger.debug("Found setup file: %s", path)
                 return path
 
         self.logger.warning(
@@ -453,42 +523,73 @@ class WorkspaceManager:
             self.logger.error(f"Failed to pull repositories in '{workspace}/src': {e}")
             sys.exit(1)
 
-    def _find_available_workspaces(
+    def _iter_available_workspaces(
             self,
-            home_dir: Path = Path.home(),
-            naming_patterns: List[str] = ["*_ws", "ros2_*"]) -> List[Path]:
-        """Find available ROS 2 workspaces in the home directory."""
-        workspaces = []
-        setup_files = [
+            home_dir: Optional[Path] = None,
+            naming_patterns: Tuple[str, ...] = _WORKSPACE_PATTERNS) -> Iterator[Path]:
+        """Lazily yield available ROS 2 workspaces in the home directory."""
+        if home_dir is None:
+            home_dir = user_home()
+        setup_files = (
             "install/setup.bash",
             "install/setup.zsh",
             "install/setup.sh",
             "devel/setup.bash",
             "devel/setup.zsh",
             "devel/setup.sh",
-        ]
+        )
+
+        try:
+            with os.scandir(home_dir) as entries:
+                candidates = [entry for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            self.logger.debug("Home directory does not exist: %s", home_dir)
+            return
 
+        seen = set()
         for naming_pattern in naming_patterns:
             self.logger.debug(
-                f"Searching for available workspaces in {home_dir} "
-                f"with pattern '{naming_pattern}'"
+                "Searching for available workspaces in %s with pattern '%s'",
+                home_dir,
+                naming_pattern,
             )
-            for dir in home_dir.glob(naming_pattern):
-                if dir.is_dir():
-                    src_dir = dir / "src"
-                    if src_dir.exists() and src_dir.is_dir():
-                        workspaces.append(dir)
-                        self.logger.debug(f"Found workspace with 'src' directory: {dir}")
-                        continue
-                    for setup_file in setup_files:
-                        setup_path = dir / setup_file
-                        if setup_path.exists():
-                            workspaces.append(dir)
-                            self.logger.debug(f"Found workspace: {dir}")
-                            break
+            for entry in candidates:
+                if entry.name in seen or not fnmatch.fnmatch(entry.name, naming_pattern):
+                    continue
+                if os.path.isdir(os.path.join(entry.path, "src")):
+                    seen.add(entry.name)
+                    self.logger.debug("Found workspace with 'src' directory: %s", entry.path)
+                    yield Path(entry.path)
+                    continue
+                for setup_file in setup_files:
+                    if os.path.exists(os.path.join(entry.path, setup_file)):
+                        seen.add(entry.name)
+                        self.logger.debug("Found workspace: %s", entry.path)
+                        yield Path(entry.path)
+                        break
 
-        self.logger.debug(f"Total workspaces found: {len(workspaces)}")
-        return workspaces
+    def _find_available_workspaces(
+            self,
+            home_dir: Optional[Path] = None,
+            naming_patterns: Tuple[str, ...] = _WORKSPACE_PATTERNS) -> List[Path]:
+        """Find available ROS 2 workspaces in the home directory."""
+        if home_dir is None:
+            home_dir = user_home()
+        key = (home_dir, tuple(naming_patterns))
+        workspaces = _available_workspaces_cache.get(key)
+        if workspaces is None:
+            workspaces = tuple(self._iter_available_workspaces(home_dir, naming_patterns))
+            _available_workspaces_cache[key] = workspaces
+        self.logger.debug("Total workspaces found: %d", len(workspaces))
+        return list(workspaces)
+
+    def _first_available_workspace(self) -> Optional[Path]:
+        """First available workspace, from the discovery cache when it is warm."""
+        workspaces = _available_workspaces_cache.get((user_home(), _WORKSPACE_PATTERNS))
+        if workspaces is not None:
+            return workspaces[0] if workspaces else None
+        # Only the first workspace is needed, so stop scanning there
+        return next(self._iter_available_workspaces(), None)
 
     def _find_ros2_underlays(self, search_dirs: List[Path] = None) -> List[Path]:
         """Search for ROS 2 installs and workspaces."""
@@ -500,17 +601,17 @@ class WorkspaceManager:
 
         for search_dir in search_dirs:
             if not search_dir.exists():
-                self.logger.debug(f"Search directory does not exist: {search_dir}")
+                self.logger.debug("Search directory does not exist: %s", search_dir)
                 continue
 
-            self.logger.debug(f"Searching in directory: {search_dir}")
+            self.logger.debug("Searching in directory: %s", search_dir)
             for subdir in search_dir.iterdir():
                 if subdir.is_dir():
                     for setup_file in setup_files:
                         setup_path = subdir / setup_file
                         if setup_path.exists():
                             underlays.append(subdir)
-                            self.logger.debug(f"Found underlay: {subdir}")
+                            self.logger.debug("Found underlay: %s", subdir)
                             break
                     else:
                         for install_type in ["install", "devel"]:
@@ -521,15 +622,16 @@ class WorkspaceManager:
                                     if setup_path.exists():
                                         underlays.append(subdir)
                                         self.logger.debug(
-                                            f"Found underlay in "
-                                            f"{install_type}: {subdir}"
+                                            "Found underlay in %s: %s",
+                                            install_type,
+                                            subdir,
                                         )
                                         break
                                 else:
                                     continue
                                 break
 
-        self.logger.debug(f"Total underlays found: {len(underlays)}")
+        self.logger.debug("Total underlays found: %d", len(underlays))
         return underlays
 
     def _prompt_for_workspace(
@@ -539,17 +641,16 @@ class WorkspaceManager:
         allow_create: bool = True,
     ) -> Path:
         """Prompt the user to select or create a workspace."""
-        if self.assume == "yes" or self.assume == "default":
+        if self.assume in ("yes", "default", "no"):
             if allow_available:
-                workspaces = self._find_available_workspaces()
-                if workspaces:
-                    selected_workspace = workspaces[0]
+                selected_workspace = self._first_available_workspace()
+                if selected_workspace:
                     self.logger.debug(
                         f"Assuming default workspace: {selected_workspace}"
                     )
                     return selected_workspace
             if allow_create and default_workspace:
-                workspace = Path(default_workspace).expanduser().resolve()
+                workspace = resolve_user_path(os.fspath(default_workspace))
                 self.logger.debug(f"Assuming default workspace path: {workspace}")
                 return workspace
             else:
@@ -577,43 +678,41 @@ class WorkspaceManager:
                     f"User selected existing workspace: {selected_workspace}"
                 )
                 return selected_workspace
-            elif allow_create and selection == len(workspaces):
-                # Prompt for new workspace path
-                workspace_input = self.user_prompter.prompt_input(
-                    "Enter the full path for the new workspace",
-                    default=str(default_workspace) if default_workspace else "",
-                )
-                workspace = Path(workspace_input).expanduser().resolve()
-                if not workspace.exists():
-                    try:
-                        workspace.mkdir(parents=True, exist_ok=True)
-                        self.logger.debug(f"Created new workspace: {workspace}")
-                    except Exception as e:
-                        self.logger.error(f"Cannot create workspace directory: {e}")
-                        sys.exit(1)
-                else:
-                    self.logger.debug(f"Selected existing workspace: {workspace}")
-                return workspace
-            else:
+            elif not (allow_create and selection == len(workspaces)):
                 self.logger.error("Invalid workspace selection.")
                 sys.exit(1)
+            message = "Enter the full path for the new workspace"
         else:
-            # Directly prompt for workspace path
+            message = "Enter the full path for the workspace"
+
+        # Keep asking until the workspace exists or can be created
+        while True:
             workspace_input = self.user_prompter.prompt_input(
-                "Enter the full path for the workspace",
+                message,
                 default=str(default_workspace) if default_workspace else "",
             )
-            workspace = Path(workspace_input).expanduser().resolve()
-            if not workspace.exists():
-                try:
-                    workspace.mkdir(parents=True, exist_ok=True)
-                    self.logger.debug(f"Created new workspace: {workspace}")
-                except Exception as e:
-                    self.logger.error(f"Cannot create workspace directory: {e}")
-                    sys.exit(1)
-            else:
-                self.logger.debug(f"Selected existing workspace: {workspace}")
+            workspace = self._accept_workspace(workspace_input)
+            if workspace is not None:
+                return workspace
+
+    def _accept_workspace(self, workspace_input: str) -> Optional[Path]:
+        """
+        Resolve a workspace path entered by the user, creating the directory
+        if needed. Returns None if it cannot be created.
+        """
+        workspace = resolve_user_path(workspace_input)
+        if workspace.exists():
+            self.logger.debug(f"Selected existing workspace: {workspace}")
             return workspace
+        try:
+            workspace.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            self.logger.error(f"Cannot create workspace directory: {e}")
+            return None
+        # The new workspace may match the discovery patterns
+        _available_workspaces_cache.clear()
+        self.logger.debug(f"Created new workspace: {workspace}")
+        return workspace
 
     def _prompt_for_underlay(
         self,
@@ -621,7 +720,7 @@ class WorkspaceManager:
         default_underlay: Optional[Path] = None,
     ) -> Optional[Path]:
         """Prompt the user to select an underlay or enter a custom path."""
-        if self.assume == "yes" or self.assume == "default":
+        if self.assume in ("yes", "default", "no"):
             if default_underlay:
                 self.logger.debug(
                     f"Assuming provided default underlay: {default_underlay}"
@@ -677,14 +776,19 @@ class WorkspaceManager:
             custom_path = self.user_prompter.prompt_input(
                 "Enter the path to the custom underlay"
             )
-            custom_underlay = Path(custom_path).expanduser().resolve()
-            if not custom_underlay.exists():
+            custom_underlay = resolve_user_path(custom_path)
+            try:
+                st = os.stat(custom_underlay)
+            except OSError:
+                st = None
+            if st is None or not stat.S_ISDIR(st.st_mode):
                 self.logger.error(
                     f"Provided underlay path does not exist: {custom_underlay}"
                 )
                 sys.exit(1)
+            # get_workspace_setup_file only returns paths it found on disk
             setup_file = self.get_workspace_setup_file(custom_underlay)
-            if not setup_file or not setup_file.exists():
+            if not setup_file:
                 self.logger.error(
                     f"No setup file found in the custom underlay: {custom_underlay}"
                 )
@@ -725,47 +829,9 @@ class WorkspaceManager:
         """
         workspace_config = None
         if self.workspace_config:
-            try:
-                # Attempt absolute path
-                workspace_config = Path(self.workspace_config).resolve()
-                self.logger.debug(
-                    f"Attempting to resolve absolute workspace config path: {workspace_config}"
-                )
-                if not workspace_config.is_file():
-                    raise ValueError
-            except Exception:
-                try:
-                    # Attempt relative to config/workspaces
-                    workspace_config = (
-                        Path(__file__).parent.parent
-                        / "config"
-                        / "workspaces"
-                        / self.workspace_config
-                    ).resolve()
-                    self.logger.debug(
-                        f"Attempting to resolve relative workspace config: {workspace_config}"
-                    )
-                    if not workspace_config.is_file():
-                        raise ValueError
-                except Exception:
-                    try:
-                        # Attempt adding .yaml extension
-                        workspace_config = (
-                            Path(__file__).parent.parent
-                            / "config"
-                            / "workspaces"
-                            / f"{self.workspace_config}.yaml"
-                        ).resolve()
-                        self.logger.debug(
-                            f"Attempting to resolve workspace config path with .yaml extension: {workspace_config}"
-                        )
-                        if not workspace_config.is_file():
-                            raise ValueError
-                    except Exception:
-                        workspace_config = None
-                        self.logger.error(
-                            "Unable to resolve workspace config argument!"
-                        )
+            workspace_config = resolve_workspace_config(self.workspace_config)
+            if workspace_config is None:
+                self.logger.error("Unable to resolve workspace config argument!")
 
         if not workspace_config:
             if available_configs is None:
@@ -809,13 +875,33 @@ class WorkspaceManager:
             self.logger.debug(f"Using provided underlay path: {underlay_path}")
             return underlay_path
 
-        if search_dirs is None:
-            search_dirs = [Path("/opt/ros"), Path.home()]
-
-        underlays = self._find_ros2_underlays(search_dirs)
+        if search_dirs is None and self._underlays_future is not None:
+            underlays = self._underlays_future.result()
+        else:
+            if search_dirs is None:
+                search_dirs = [Path("/opt/ros"), user_home()]
+            underlays = self._find_ros2_underlays(search_dirs)
 
         return self._prompt_for_underlay(underlays, default_underlay=default_underlay)
 
+    def prefetch_underlays(self):
+        """
+        Start searching the default locations for underlays in a background
+        thread, so the search overlaps with earlier prompts. The result is
+        picked up by get_or_prompt_underlay_path(). Nothing is started when
+        prompts are answered automatically, as there is no wait to hide.
+        """
+        if self.underlay_path or self.assume or self._underlays_future is not None:
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._underlays_future = executor.submit(
+            self._find_ros2_underlays, [Path("/opt/ros"), user_home()]
+        )
+        executor.shutdown(wait=False)
+
     def get_or_prompt_build_script_path(
         self,
         default_build_script: Optional[Path] = None,
@@ -837,29 +923,28 @@ class WorkspaceManager:
                 sys.exit(1)
             else:
                 self.logger.debug(f"Using provided build script path: {build_script_path}")
-                return Path(build_script_path).expanduser().resolve()
+                return resolve_user_path(os.fspath(build_script_path))
 
         return self._prompt_for_build_script(
             scripts=None,
             default_script=default_build_script,
         )
 
-    def _get_available_workspace_configs(self) -> List[Path]:
+    def _get_available_workspace_configs(self) -> Tuple[Path, ...]:
         """
         Retrieve available workspace configuration files.
         """
-        workspaces_dir = Path(__file__).parent.parent / "config" / "workspaces"
-        workspace_configs = list(workspaces_dir.glob("*.yaml"))
-        self.logger.debug(f"Found workspace configs: {workspace_configs}")
+        workspace_configs = list_workspace_configs()
+        self.logger.debug("Found workspace configs: %s", workspace_configs)
         return workspace_configs
 
     def _prompt_for_workspace_config(
-        self, workspace_configs: List[Path], default_config: Optional[Path] = None
+        self, workspace_configs: Sequence[Path], default_config: Optional[Path] = None
     ) -> Path:
         """
         Prompt the user to select a workspace configuration from the available options.
         """
-        if self.assume == "yes" or self.assume == "default":
+        if self.assume in ("yes", "default", "no"):
             selected_config = default_config or (workspace_configs[0] if workspace_configs else None)
             if selected_config:
                 self.logger.debug(
@@ -890,22 +975,20 @@ class WorkspaceManager:
         custom_config = self.user_prompter.prompt_input(
             "Enter the path to the custom workspace config"
         )
-        custom_config_path = Path(custom_config).expanduser().resolve()
-
-        if not custom_config_path.is_file():
+        custom_config = os.path.expanduser(custom_config)
+        if not cached_isfile(custom_config):
             self.logger.error(
-                f"Custom workspace config does not exist: {custom_config_path}"
+                f"Custom workspace config does not exist: {custom_config}"
             )
             sys.exit(1)
 
+        custom_config_path = absolute_user_path(custom_config)
         self.logger.debug(f"User provided custom workspace config: {custom_config_path}")
         return custom_config_path
 
     def _get_available_build_scripts(self) -> List[Path]:
         """Get available ROS 2 workspace build scripts"""
-        scripts_dir = Path(__file__).parent.parent / 'config' / 'scripts'
-        pattern = f"build_*.yaml"
-        return list(scripts_dir.glob(pattern))
+        return list(list_build_scripts())
 
     def _prompt_for_build_script(self,
             scripts: Optional[List[Path]],
@@ -0,0 +1,126 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from arcscfg.utils.backer_upper import BackerUpper
+from arcscfg.utils.logger import NullLogger
+
+# A plausible time.time_ns() value, well clear of legacy numbered suffixes
+_NOW_NS = 1_700_000_000_000_000_000
+
+
+class TestBackerUpper(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.file_path = self.root / ".bashrc"
+        self.file_path.write_text("current")
+        self.backup_dir = self.root / ".arcscfg_backups"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _backups(self):
+        return sorted(os.listdir(self.backup_dir))
+
+    def _backer_upper(self, backup_count):
+        return BackerUpper(backup_count=backup_count, logger=NullLogger())
+
+    def _clock(self, *stamps):
+        """Patch time.time_ns() to return the given stamps in order."""
+        return mock.patch(
+            "arcscfg.utils.backer_upper.time.time_ns", side_effect=list(stamps)
+        )
+
+    def _contents(self):
+        return sorted((self.backup_dir / name).read_text() for name in self._backups())
+
+    def test_creates_timestamped_copy(self):
+        self._backer_upper(3).backup(self.file_path)
+
+        backups = self._backups()
+        self.assertEqual(len(backups), 1)
+        name = backups[0]
+        self.assertTrue(name.startswith(".bashrc."))
+        self.assertTrue(name[len(".bashrc."):].isdigit())
+        self.assertEqual((self.backup_dir / name).read_text(), "current")
+
+    def test_missing_file_is_not_backed_up(self):
+        self._backer_upper(3).backup(self.root / "missing")
+        self.assertFalse(self.backup_dir.exists())
+
+    def test_prunes_oldest_beyond_backup_count(self):
+        backer_upper = self._backer_upper(3)
+        with self._clock(*(_NOW_NS + i for i in range(5))):
+            for i in range(5):
+                self.file_path.write_text(str(i))
+                backer_upper.backup(self.file_path)
+
+        self.assertEqual(self._contents(), ["2", "3", "4"])
+
+    def test_same_timestamp_does_not_overwrite(self):
+        backer_upper = self._backer_upper(3)
+        with self._clock(_NOW_NS, _NOW_NS):
+            self.file_path.write_text("first")
+            backer_upper.backup(self.file_path)
+            self.file_path.write_text("second")
+            backer_upper.backup(self.file_path)
+
+        self.assertEqual(self._contents(), ["first", "second"])
+
+    def test_clock_stepping_back_keeps_new_backup(self):
+        backer_upper = self._backer_upper(2)
+        with self._clock(_NOW_NS + 10, _NOW_NS + 20, _NOW_NS):
+            for text in ("first", "second", "third"):
+                self.file_path.write_text(text)
+                backer_upper.backup(self.file_path)
+
+        # The third backup sorts oldest but was just written, so it survives
+        self.assertEqual(self._contents(), ["second", "third"])
+
+    def test_ignores_other_files_backups(self):
+        self.backup_dir.mkdir()
+        other = self.backup_dir / ".bashrc.bak.1"
+        other.write_text("other")
+
+        backer_upper = self._backer_upper(1)
+        backer_upper.backup(self.file_path)
+        backer_upper.backup(self.file_path)
+
+        self.assertTrue(other.exists())
+        self.assertEqual(len(self._backups()), 2)
+
+    def test_zero_backup_count_keeps_new_backup(self):
+        self._backer_upper(0).backup(self.file_path)
+        self.assertEqual(len(self._backups()), 1)
+
+    def test_legacy_numbered_backups_pruned_oldest_first(self):
+        self.backup_dir.mkdir()
+        # Old rotation scheme: .1 is the newest, .3 the oldest
+        for i in (1, 2, 3):
+            (self.backup_dir / f".bashrc.{i}").write_text(f"legacy {i}")
+
+        self._backer_upper(3).backup(self.file_path)
+
+        backups = self._backups()
+        self.assertEqual(len(backups), 3)
+        self.assertIn(".bashrc.1", backups)
+        self.assertIn(".bashrc.2", backups)
+        self.assertNotIn(".bashrc.3", backups)
+
+    def test_legacy_numbered_backups_pruned_before_timestamped(self):
+        backer_upper = self._backer_upper(2)
+        backer_upper.backup(self.file_path)
+        (self.backup_dir / ".bashrc.1").write_text("legacy")
+
+        backer_upper.backup(self.file_path)
+
+        backups = self._backups()
+        self.assertEqual(len(backups), 2)
+        self.assertNotIn(".bashrc.1", backups)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+from arcscfg.cli import _sniff_subcommand
+
+
+class TestSniffSubcommand(unittest.TestCase):
+    def test_plain_command(self):
+        self.assertEqual(_sniff_subcommand(["install", "-ir"]), "install")
+
+    def test_no_command(self):
+        self.assertIsNone(_sniff_subcommand([]))
+        self.assertIsNone(_sniff_subcommand(["-y"]))
+
+    def test_unknown_command(self):
+        self.assertIsNone(_sniff_subcommand(["bogus", "install"]))
+
+    def test_value_option_skips_its_value(self):
+        self.assertEqual(_sniff_subcommand(["-v", "debug", "build"]), "build")
+        # A value that happens to be a command name is not the command
+        self.assertEqual(_sniff_subcommand(["-bd", "install", "build"]), "build")
+
+    def test_option_with_equals(self):
+        self.assertEqual(_sniff_subcommand(["--verbosity=debug", "setup"]), "setup")
+        self.assertEqual(_sniff_subcommand(["-bkc=3", "setup"]), "setup")
+
+    def test_long_option_prefix(self):
+        self.assertEqual(_sniff_subcommand(["--verb", "debug", "update"]), "update")
+        self.assertEqual(
+            _sniff_subcommand(["--log-file", "install", "config"]), "config"
+        )
+
+    def test_multi_char_short_prefix(self):
+        self.assertEqual(_sniff_subcommand(["-bk", "3", "build"]), "build")
+
+    def test_clustered_flags(self):
+        self.assertEqual(_sniff_subcommand(["-yd", "install"]), "install")
+        self.assertEqual(
+            _sniff_subcommand(["-yv", "debug", "install", "-ir"]), "install"
+        )
+        # -v takes the rest of the cluster as its value
+        self.assertEqual(_sniff_subcommand(["-yvdebug", "install"]), "install")
+        self.assertEqual(_sniff_subcommand(["-vdebug", "install"]), "install")
+
+    def test_help_before_command(self):
+        self.assertIsNone(_sniff_subcommand(["-h", "install"]))
+        self.assertIsNone(_sniff_subcommand(["--help", "install"]))
+        self.assertIsNone(_sniff_subcommand(["--he", "install"]))
+        self.assertIsNone(_sniff_subcommand(["-yh", "install"]))
+
+    def test_help_after_command(self):
+        self.assertEqual(_sniff_subcommand(["install", "-h"]), "install")
+        self.assertEqual(
+            _sniff_subcommand(["-yv", "debug", "install", "--help"]), "install"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
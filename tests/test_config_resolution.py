@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from arcscfg.commands import install
+from arcscfg.utils import workspace_manager
+from arcscfg.utils.paths import cached_isfile
+
+
+class _ResolverTestMixin:
+    """
+    Shared cases for the config name resolvers. Subclasses define `resolve`
+    and set `module` and `config_dir_attr`, the module attribute holding the
+    bundled config dir.
+    """
+
+    module = None
+    config_dir_attr = None
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        # Registered first so it runs last, after leaving the temp cwd
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name).resolve()
+        self.config_dir = root / "config"
+        self.home = root / "home"
+        self.cwd = root / "cwd"
+        for directory in (self.config_dir, self.home, self.cwd):
+            directory.mkdir()
+
+        patches = (
+            mock.patch.object(self.module, self.config_dir_attr, str(self.config_dir)),
+            mock.patch.dict(os.environ, {"HOME": str(self.home)}),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        old_cwd = os.getcwd()
+        os.chdir(self.cwd)
+        self.addCleanup(os.chdir, old_cwd)
+
+        # Lookups are cached per path string, and the temp paths may repeat
+        cached_isfile.cache_clear()
+        self.addCleanup(cached_isfile.cache_clear)
+
+    def resolve(self, value):
+        raise NotImplementedError
+
+    def test_bare_name_resolves_to_yaml(self):
+        (self.config_dir / "cohort.yaml").write_text("{}")
+        self.assertEqual(self.resolve("cohort"), self.config_dir / "cohort.yaml")
+
+    def test_bare_name_resolves_to_yml(self):
+        (self.config_dir / "cohort.yml").write_text("{}")
+        self.assertEqual(self.resolve("cohort"), self.config_dir / "cohort.yml")
+
+    def test_file_name_in_config_dir(self):
+        (self.config_dir / "cohort.yaml").write_text("{}")
+        self.assertEqual(self.resolve("cohort.yaml"), self.config_dir / "cohort.yaml")
+
+    def test_relative_path(self):
+        (self.cwd / "sub").mkdir()
+        (self.cwd / "sub" / "custom.yaml").write_text("{}")
+        self.assertEqual(
+            self.resolve(os.path.join("sub", "custom.yaml")),
+            self.cwd / "sub" / "custom.yaml",
+        )
+
+    def test_absolute_path(self):
+        custom = self.home / "custom.yaml"
+        custom.write_text("{}")
+        self.assertEqual(self.resolve(str(custom)), custom)
+
+    def test_home_path(self):
+        (self.home / "custom.yaml").write_text("{}")
+        self.assertEqual(
+            self.resolve(os.path.join("~", "custom.yaml")),
+            self.home / "custom.yaml",
+        )
+
+    def test_unknown_name(self):
+        (self.config_dir / "cohort.yaml").write_text("{}")
+        self.assertIsNone(self.resolve("missing"))
+
+    def test_directory_is_not_a_config(self):
+        (self.config_dir / "cohort").mkdir()
+        self.assertIsNone(self.resolve("cohort"))
+
+
+class TestResolveWorkspaceConfig(_ResolverTestMixin, unittest.TestCase):
+    module = workspace_manager
+    config_dir_attr = "_WORKSPACES_DIR_STR"
+
+    def resolve(self, value):
+        return workspace_manager.resolve_workspace_config(value)
+
+    def test_empty_value(self):
+        self.assertIsNone(self.resolve(""))
+
+    def test_explicit_path_skips_config_dir(self):
+        (self.config_dir / "sub").mkdir()
+        (self.config_dir / "sub" / "custom.yaml").write_text("{}")
+        self.assertIsNone(self.resolve(os.path.join("sub", "custom.yaml")))
+
+
+class TestResolveDependenciesFile(_ResolverTestMixin, unittest.TestCase):
+    module = install
+    config_dir_attr = "_DEPENDENCIES_DIR_STR"
+
+    def resolve(self, value):
+        return install.resolve_dependencies_file(value)
+
+
+if __name__ == "__main__":
+    unittest.main()